@@ -1,19 +1,54 @@
-"""Runtime hook: ensure faster_whisper.utils.get_assets_path() works in frozen builds."""
+"""Runtime hook: ensure faster_whisper.utils.get_assets_path() works in frozen builds.
 
+The patch is applied lazily, when faster_whisper.utils is first imported, so
+launches that never touch the model (e.g. `voice-dictation client`) don't pay
+for importing faster_whisper, numpy, av and ctranslate2 at startup.
+"""
+
+import importlib.abc
+import importlib.util
 import os
 import sys
 
 
+class _PatchingLoader(importlib.abc.Loader):
+    def __init__(self, loader, assets):
+        self._loader = loader
+        self._assets = assets
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        assets = self._assets
+        module.get_assets_path = lambda: assets
+
+
+class _AssetsPathFinder(importlib.abc.MetaPathFinder):
+    """Patches faster_whisper.utils as it loads — before faster_whisper.vad binds the name."""
+
+    def __init__(self, assets):
+        self._assets = assets
+
+    def find_spec(self, name, path, target=None):
+        if name != "faster_whisper.utils":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _PatchingLoader(spec.loader, self._assets)
+        return spec
+
+
 def _patch_assets_path():
     if not getattr(sys, "frozen", False):
         return
 
-    import faster_whisper.utils as utils
-
     meipass = sys._MEIPASS
     assets = os.path.join(meipass, "faster_whisper", "assets")
     if os.path.isdir(assets):
-        utils.get_assets_path = lambda: assets
+        sys.meta_path.insert(0, _AssetsPathFinder(assets))
 
 
 _patch_assets_path()
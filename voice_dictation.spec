@@ -59,6 +59,15 @@ a = Analysis(
         "voice_dictation.transcriber",
         "voice_dictation.processor",
         "voice_dictation.output",
+        "voice_dictation.pipeline",
+        "voice_dictation.batch",
+        "voice_dictation.spool",
+        "voice_dictation.replay",
+        "voice_dictation.session",
+        "voice_dictation.daemon",
+        "voice_dictation.client",
+        "voice_dictation.guard",
+        "voice_dictation.log",
         "torch",
         "ctranslate2",
         "onnxruntime",
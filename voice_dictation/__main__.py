@@ -4,13 +4,14 @@ import argparse
 import signal
 import sys
 import time
+from pathlib import Path
 
-import numpy as np
+from .log import log
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None, daemon: bool = False) -> argparse.Namespace:
     p = argparse.ArgumentParser(
-        prog="voice-dictation",
+        prog="voice-dictation daemon" if daemon else "voice-dictation",
         description="Real-time voice dictation using local Whisper models on GPU.",
     )
     p.add_argument("--model", default="distil-large-v3",
@@ -24,8 +25,8 @@ def parse_args() -> argparse.Namespace:
                    help="List available audio input devices and exit")
     p.add_argument("--chunk-size", type=float, default=0.5,
                    help="Min audio chunk in seconds (default: 0.5)")
-    p.add_argument("--beam-size", type=int, default=1,
-                   help="Beam size for decoding (default: 1)")
+    p.add_argument("--beam-size", type=int, default=5,
+                   help="Beam size for the final pass of each utterance; partial passes are greedy (default: 5)")
     p.add_argument("--compute-type", default="float16",
                    choices=["float16", "int8_float16", "int8"],
                    help="Compute type (default: float16)")
@@ -37,12 +38,12 @@ def parse_args() -> argparse.Namespace:
                    help="Console test mode: print transcription to stdout instead of typing keystrokes")
     p.add_argument("--keyboard-delay", type=float, default=0.0,
                    help="Delay between keystrokes in seconds (default: 0.0)")
-    return p.parse_args()
-
-
-def log(msg: str):
-    """Always print status to stderr so it shows even in --keyboard mode."""
-    print(msg, file=sys.stderr, flush=True)
+    p.add_argument("--record", type=Path, default=None, metavar="DIR",
+                   help="Spool session audio and events under DIR for later replay")
+    if daemon:
+        p.add_argument("--socket", default=None,
+                       help="Socket path or loopback port to listen on (default: per-user socket in the temp dir)")
+    return p.parse_args(argv)
 
 
 def print_banner(args, gpu_name: str, device_name: str):
@@ -71,8 +72,42 @@ def get_gpu_name() -> str:
         return "Unknown"
 
 
+def check_cuda():
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            print("ERROR: No CUDA GPU detected.", file=sys.stderr)
+            print("  This application requires an NVIDIA GPU with CUDA 12 support.", file=sys.stderr)
+            print("  Check your drivers: nvidia-smi", file=sys.stderr)
+            sys.exit(1)
+    except ImportError:
+        print("ERROR: PyTorch not installed. Install with: pip install torch", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
-    args = parse_args()
+    # Subcommands get their own parsers; plain flags keep running live dictation.
+    # `client` must stay first and light: it never imports numpy or faster-whisper.
+    if sys.argv[1:2] == ["client"]:
+        from . import client
+        client.main(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["batch"]:
+        from . import batch
+        batch_args = batch.parse_args(sys.argv[2:])
+        check_cuda()
+        batch.run(batch_args)
+        return
+    if sys.argv[1:2] == ["replay"]:
+        from . import replay
+        replay_args = replay.parse_args(sys.argv[2:])
+        if not replay_args.list:
+            check_cuda()
+        replay.run(replay_args)
+        return
+
+    daemon = sys.argv[1:2] == ["daemon"]
+    args = parse_args(sys.argv[2:] if daemon else None, daemon=daemon)
 
     # --list-devices
     if args.list_devices:
@@ -88,23 +123,15 @@ def main():
         print(f"\nUse --device <number> to select.")
         sys.exit(0)
 
-    # Check CUDA
-    try:
-        import torch
-        if not torch.cuda.is_available():
-            print("ERROR: No CUDA GPU detected.", file=sys.stderr)
-            print("  This application requires an NVIDIA GPU with CUDA 12 support.", file=sys.stderr)
-            print("  Check your drivers: nvidia-smi", file=sys.stderr)
-            sys.exit(1)
-    except ImportError:
-        print("ERROR: PyTorch not installed. Install with: pip install torch", file=sys.stderr)
-        sys.exit(1)
+    check_cuda()
 
     # Load components
     from .audio import AudioCapture
     from .vad import VADFilter
     from .transcriber import TranscriptionEngine
-    from .processor import StreamingProcessor
+    from .guard import HallucinationGuard
+    from .pipeline import Pipeline
+    from .session import run_session
     from .output import ConsoleOutput
 
     gpu_name = get_gpu_name()
@@ -126,7 +153,22 @@ def main():
     )
     log("Loading VAD... done.")
 
-    processor = StreamingProcessor(engine, chunk_size=args.chunk_size)
+    recorder = None
+    if args.record is not None:
+        from .spool import SessionRecorder
+        session_dir = args.record / time.strftime("session-%Y%m%d-%H%M%S")
+        recorder = SessionRecorder(session_dir)
+        log(f"Recording session to {session_dir}")
+
+    guard = HallucinationGuard()
+    pipeline = Pipeline(
+        engine,
+        vad,
+        chunk_size=args.chunk_size,
+        min_silence_ms=args.min_silence_ms,
+        recorder=recorder,
+        guard=guard,
+    )
 
     if args.console:
         output = ConsoleOutput()
@@ -134,8 +176,7 @@ def main():
         from .output import KeyboardOutput
         output = KeyboardOutput(delay=args.keyboard_delay)
 
-    audio = AudioCapture(device=args.device)
-    devices = audio.list_devices()
+    devices = AudioCapture.list_devices()
     device_name = "Unknown"
     if args.device is not None:
         for d in devices:
@@ -149,91 +190,42 @@ def main():
                 break
 
     print_banner(args, gpu_name, device_name)
-    log("Listening. Speak now. (Ctrl+C to stop)")
-    if not args.console:
-        log(">>> Alt+Tab to your target window now <<<")
-    log("")
-
-    # Graceful shutdown
-    shutdown = False
-
-    def on_sigint(sig, frame):
-        nonlocal shutdown
-        shutdown = True
-
-    signal.signal(signal.SIGINT, on_sigint)
-
-    audio.start()
-
-    speaking = False
-    silence_chunks = 0
-    # Audio chunks are ~100ms each.
-    # Short silence: keep accumulating audio (natural pauses between words)
-    # Long silence: finalize the utterance
-    # Use a generous threshold — natural speech has 300-500ms pauses between phrases.
-    # Only finalize after sustained silence (min_silence_ms, default 600ms = 6 chunks).
-    silence_limit = max(3, args.min_silence_ms // 100)
 
     try:
-        while not shutdown:
-            chunk = audio.get_audio(timeout=0.1)
-            if chunk is None:
-                continue
-
-            has_speech = vad.is_speech(chunk)
-
-            if has_speech:
-                if not speaking:
-                    speaking = True
-                    log("[listening...]")
-
-                silence_chunks = 0
-
-                # Feed audio to processor — transcribes periodically
-                confirmed, partial = processor.feed_audio(chunk)
-
-                if confirmed:
-                    output.print_confirmed(confirmed)
-                    log(f"[confirmed] {confirmed.strip()}")
-                if partial and args.console:
-                    output.print_partial(partial)
-
-            elif speaking:
-                # Brief silence while in a speech session — KEEP feeding audio.
-                # This is critical: natural speech has pauses between words/phrases.
-                # We keep accumulating so Whisper sees the full context.
-                confirmed, partial = processor.feed_audio(chunk)
-
-                if confirmed:
-                    output.print_confirmed(confirmed)
-                    log(f"[confirmed] {confirmed.strip()}")
-                if partial and args.console:
-                    output.print_partial(partial)
-
-                silence_chunks += 1
-
-                if silence_chunks >= silence_limit:
-                    # Long silence — finalize this utterance
-                    remaining = processor.finish()
-                    if remaining:
-                        output.print_confirmed(remaining)
-                        log(f"[flushed] {remaining.strip()}")
-                    output.print_confirmed(" ")
-                    speaking = False
-                    silence_chunks = 0
-                    vad.reset()
-                    log("[end of utterance]")
-
-    except Exception as e:
-        log(f"\nError: {e}")
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        if daemon:
+            from .daemon import DictationDaemon
+            DictationDaemon(pipeline, output, args.device, args.console).serve(args.socket)
+        else:
+            log("Listening. Speak now. (Ctrl+C to stop)")
+            if not args.console:
+                log(">>> Alt+Tab to your target window now <<<")
+            log("")
+
+            # Graceful shutdown
+            shutdown = False
+
+            def on_sigint(sig, frame):
+                nonlocal shutdown
+                shutdown = True
+
+            signal.signal(signal.SIGINT, on_sigint)
+
+            audio = AudioCapture(device=args.device)
+            audio.start()
+            run_session(audio, pipeline, output, args.console, lambda: shutdown)
     finally:
-        audio.stop()
-        remaining = processor.finish()
-        if remaining:
-            output.print_confirmed(remaining)
-        output.commit_line()
+        if recorder is not None:
+            recorder.close()
+        stats = engine.stats_lines()
+        if stats:
+            log("\nDecode profiles:")
+            for line in stats:
+                log(line)
+        suppressed = guard.stats_lines()
+        if suppressed:
+            log("\nHallucination guard:")
+            for line in suppressed:
+                log(line)
         log("\n--- Dictation ended. ---")
 
 
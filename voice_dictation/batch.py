@@ -0,0 +1,220 @@
+"""Batch transcription of recorded audio files, resumable via a JSONL results file."""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+
+from .log import log
+
+MAX_UTTERANCE_S = 30.0
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".webm", ".aac", ".wma", ".mp4"}
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="voice-dictation batch",
+        description="Transcribe a directory of recordings to JSONL.",
+    )
+    p.add_argument("directory", type=Path,
+                   help="Directory to scan recursively for audio files")
+    p.add_argument("-o", "--output", type=Path, default=None,
+                   help="JSONL results file; existing results are skipped (default: <directory>/transcripts.jsonl)")
+    p.add_argument("--model", default="distil-large-v3",
+                   choices=["tiny", "base", "small", "medium", "large-v2", "large-v3", "large-v3-turbo", "distil-large-v3"],
+                   help="Whisper model (default: distil-large-v3)")
+    p.add_argument("--language", default="en",
+                   help="Language code, e.g. en, es, de (default: en)")
+    p.add_argument("--beam-size", type=int, default=5,
+                   help="Beam size for the final pass of each utterance; partial passes are greedy (default: 5)")
+    p.add_argument("--compute-type", default="float16",
+                   choices=["float16", "int8_float16", "int8"],
+                   help="Compute type (default: float16)")
+    p.add_argument("--vad-threshold", type=float, default=0.4,
+                   help="VAD speech probability threshold (default: 0.4)")
+    p.add_argument("--min-silence-ms", type=int, default=400,
+                   help="Min silence duration to end speech segment in ms (default: 400)")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                   help="Files decoded and segmented in parallel (default: CPU count)")
+    p.add_argument("--model-workers", type=int, default=1,
+                   help="Concurrent transcriptions on the GPU; each adds model memory (default: 1)")
+    return p.parse_args(argv)
+
+
+def find_audio_files(root: Path) -> list[Path]:
+    return sorted(
+        p for p in root.rglob("*")
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+    )
+
+
+def load_done(results_path: Path) -> set[str]:
+    """Paths already transcribed successfully. Failed, truncated and malformed lines are retried."""
+    done = set()
+    if not results_path.exists():
+        return done
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial line from an interrupted run
+            if isinstance(record, dict) and "path" in record and "error" not in record:
+                done.add(record["path"])
+    return done
+
+
+def iter_audio_file(path: Path, sample_rate: int = 16000, block_duration_ms: int = 100):
+    """Decode an audio file incrementally, yielding 16 kHz mono float32 blocks.
+
+    Uses PyAV (a faster-whisper dependency) so the whole file is never held in memory.
+    """
+    import av
+
+    block_size = sample_rate * block_duration_ms // 1000
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    pending = np.zeros(0, dtype=np.float32)
+
+    def frames_to_audio(frames) -> np.ndarray:
+        parts = [f.to_ndarray().reshape(-1) for f in frames]
+        if not parts:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(parts).astype(np.float32) / 32768.0
+
+    with av.open(str(path), metadata_errors="ignore") as container:
+        for frame in container.decode(audio=0):
+            pending = np.concatenate([pending, frames_to_audio(resampler.resample(frame))])
+            while len(pending) >= block_size:
+                yield pending[:block_size]
+                pending = pending[block_size:]
+        # Flush samples buffered inside the resampler
+        pending = np.concatenate([pending, frames_to_audio(resampler.resample(None))])
+
+    for start in range(0, len(pending), block_size):
+        yield pending[start:start + block_size]
+
+
+def transcribe_file(path: Path, engine, vad, guard, args: argparse.Namespace) -> dict:
+    """VAD-segment one file and transcribe each utterance once."""
+    from .pipeline import EndpointEvent, Pipeline
+
+    # An infinite chunk interval disables partial passes: each utterance is
+    # transcribed exactly once, when the pipeline endpoints it. Utterances are
+    # capped at one 30 s Whisper window so continuous audio stays bounded.
+    pipeline = Pipeline(
+        engine,
+        vad,
+        chunk_size=float("inf"),
+        min_silence_ms=args.min_silence_ms,
+        guard=guard,
+        max_utterance_s=MAX_UTTERANCE_S,
+    )
+    segments = []
+    num_samples = 0
+    events = []
+    for block in iter_audio_file(path):
+        num_samples += len(block)
+        events.extend(pipeline.feed(block))
+    events.extend(pipeline.flush())
+    for event in events:
+        if isinstance(event, EndpointEvent) and event.text:
+            segments.append(event.text)
+
+    return {
+        "duration": round(num_samples / 16000, 3),
+        "text": " ".join(segments),
+        "segments": segments,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    from .vad import VADFilter
+    from .transcriber import TranscriptionEngine
+    from .guard import HallucinationGuard
+
+    root = args.directory
+    if not root.is_dir():
+        log(f"ERROR: Not a directory: {root}")
+        sys.exit(1)
+    results_path = args.output or root / "transcripts.jsonl"
+
+    files = find_audio_files(root)
+    done = load_done(results_path)
+    todo = [p for p in files if p.relative_to(root).as_posix() not in done]
+    log(f"Found {len(files)} audio files, {len(files) - len(todo)} already done, {len(todo)} to transcribe.")
+    if not todo:
+        return
+
+    engine = TranscriptionEngine(
+        model_name=args.model,
+        compute_type=args.compute_type,
+        language=args.language,
+        beam_size=args.beam_size,
+        num_workers=args.model_workers,
+    )
+    # Silero ONNX keeps no state between calls, so one filter serves all workers
+    vad = VADFilter(threshold=args.vad_threshold)
+    guard = HallucinationGuard()
+
+    workers = max(1, args.workers)
+    log(f"Transcribing with {workers} workers ({args.model_workers} model workers)...")
+
+    completed = 0
+    failed = 0
+    audio_seconds = 0.0
+    start = time.monotonic()
+
+    # A run killed mid-write can leave a partial last line; start on a fresh one
+    needs_newline = False
+    if results_path.exists() and results_path.stat().st_size > 0:
+        with open(results_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+
+    def write_result(future, path: Path):
+        nonlocal completed, failed, audio_seconds
+        record = {"path": path.relative_to(root).as_posix()}
+        try:
+            record.update(future.result())
+            audio_seconds += record["duration"]
+            completed += 1
+        except Exception as e:
+            record["error"] = str(e)
+            failed += 1
+            log(f"[error] {record['path']}: {e}")
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        log(f"[{completed + failed}/{len(todo)}] {record['path']}")
+
+    with open(results_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        if needs_newline:
+            out.write("\n")
+        pending = {pool.submit(transcribe_file, p, engine, vad, guard, args): p for p in todo}
+        try:
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    write_result(future, pending.pop(future))
+        except KeyboardInterrupt:
+            log("\nInterrupted — finishing files in progress, rerun to resume.")
+            pool.shutdown(wait=True, cancel_futures=True)
+            # Save work that completed while shutting down instead of redoing it on resume
+            for future, path in pending.items():
+                if future.done() and not future.cancelled():
+                    write_result(future, path)
+
+    elapsed = time.monotonic() - start
+    log("")
+    log(f"Done: {completed} transcribed, {failed} failed in {elapsed:.1f}s")
+    if elapsed > 0:
+        log(f"  {(completed + failed) / elapsed:.2f} files/s")
+        log(f"  {audio_seconds / elapsed:.1f} audio hours per wall-clock hour")
+    for line in engine.stats_lines() + guard.stats_lines():
+        log(line)
+    log(f"  Results: {results_path}")
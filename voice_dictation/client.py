@@ -0,0 +1,84 @@
+"""Lightweight client for the dictation daemon.
+
+Standard library only — no numpy or faster-whisper — so it starts instantly.
+"""
+
+import argparse
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+
+COMMANDS = ["start", "stop", "toggle", "status", "shutdown"]
+
+# Loopback port used where AF_UNIX is unavailable (CPython on Windows)
+DEFAULT_PORT = 47321
+
+
+def default_address() -> str:
+    if hasattr(socket, "AF_UNIX"):
+        base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+        return os.path.join(base, f"voice-dictation-{getpass.getuser()}.sock")
+    return str(DEFAULT_PORT)
+
+
+def token_path(address: str) -> str:
+    """Per-user file holding the daemon's auth token for `address`.
+
+    The loopback TCP fallback is reachable by any local process, so every
+    command must carry this token; only the daemon's user can read the file.
+    """
+    if address.isdigit():
+        return os.path.join(tempfile.gettempdir(), f"voice-dictation-{getpass.getuser()}-{address}.token")
+    return address + ".token"
+
+
+def make_socket(address: str) -> tuple[socket.socket, str | tuple[str, int]]:
+    """Socket and bind/connect target for `address` (a socket path, or a loopback port number)."""
+    if address.isdigit():
+        return socket.socket(socket.AF_INET, socket.SOCK_STREAM), ("127.0.0.1", int(address))
+    return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM), address
+
+
+def send_command(command: str, address: str | None = None, timeout: float = 30.0) -> dict:
+    """Send one `<token> <command>` line, return the daemon's JSON reply."""
+    address = address or default_address()
+    with open(token_path(address), encoding="utf-8") as f:
+        token = f.read().strip()
+    sock, target = make_socket(address)
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(target)
+        sock.sendall(f"{token} {command}\n".encode())
+        with sock.makefile("r", encoding="utf-8") as f:
+            return json.loads(f.readline())
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="voice-dictation client",
+        description="Control a running `voice-dictation daemon`.",
+    )
+    p.add_argument("command", choices=COMMANDS,
+                   help="start/stop/toggle a dictation session, query status, or shut the daemon down")
+    p.add_argument("--socket", default=None,
+                   help=f"Daemon socket path or loopback port (default: {default_address()})")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    try:
+        reply = send_command(args.command, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("No daemon running. Start one with: voice-dictation daemon", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        # Timeouts, resets, or an empty/garbled reply
+        print(f"error: no valid reply from daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(reply["state"] if reply["ok"] else f"error: {reply['message']}")
+    if not reply["ok"]:
+        sys.exit(1)
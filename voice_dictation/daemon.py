@@ -0,0 +1,149 @@
+"""Resident daemon — keeps the model and VAD warm, runs sessions on client request."""
+
+import hmac
+import json
+import os
+import secrets
+import socket
+import sys
+import threading
+
+from .client import default_address, make_socket, token_path
+from .log import log
+from .session import run_session
+
+
+class DictationDaemon:
+    """Serves start/stop/toggle/status/shutdown commands, one line each, over a local socket."""
+
+    def __init__(self, pipeline, output, device: int | None, console: bool):
+        self._pipeline = pipeline
+        self._output = output
+        self._device = device
+        self._console = console
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._token = secrets.token_hex(16)
+
+    @property
+    def listening(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start_session(self) -> None:
+        from .audio import AudioCapture
+
+        # Fresh capture per session so no stale blocks leak in from the last one.
+        # Open the stream here, not in the worker, so a busy or invalid device
+        # fails the client's command instead of killing the thread after "ok".
+        audio = AudioCapture(device=self._device)
+        audio.start()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=run_session,
+            args=(audio, self._pipeline, self._output, self._console, self._stop.is_set),
+            name="dictation-session",
+            daemon=True,
+        )
+        self._thread.start()
+        log("[session started]")
+
+    def stop_session(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()  # includes the final flush of the open utterance
+        self._thread = None
+        log("[session stopped]")
+
+    def handle(self, command: str) -> tuple[dict, bool]:
+        """Apply one command. Returns (reply, keep_serving)."""
+        if command == "toggle":
+            command = "stop" if self.listening else "start"
+
+        if command == "start":
+            if self.listening:
+                return self._reply(False, "already listening"), True
+            self.start_session()
+        elif command == "stop":
+            self.stop_session()
+        elif command == "shutdown":
+            self.stop_session()
+            return self._reply(True, state="stopped"), False
+        elif command != "status":
+            return self._reply(False, f"unknown command: {command!r}"), True
+        return self._reply(True), True
+
+    def _reply(self, ok: bool, message: str = "", state: str | None = None) -> dict:
+        if state is None:
+            state = "listening" if self.listening else "idle"
+        return {"ok": ok, "state": state, "message": message}
+
+    def serve(self, address: str | None = None) -> None:
+        address = address or default_address()
+        server, target = make_socket(address)
+        if server.family == getattr(socket, "AF_UNIX", None):
+            _remove_stale_socket(target)
+        server.bind(target)
+        if isinstance(target, str):
+            os.chmod(target, 0o600)
+        server.listen()
+        # Periodic timeout so Ctrl+C is noticed while waiting in accept()
+        server.settimeout(0.5)
+        token_file = token_path(address)
+        # Created fresh and owner-only; the client must echo the token with every command
+        if os.path.exists(token_file):
+            os.unlink(token_file)
+        fd = os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self._token)
+        log(f"Daemon ready on {address}. Control with: voice-dictation client start|stop|toggle|status|shutdown")
+
+        try:
+            serving = True
+            while serving:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    conn.settimeout(5.0)
+                    try:
+                        with conn.makefile("r", encoding="utf-8") as f:
+                            token, _, command = f.readline().strip().partition(" ")
+                        if not hmac.compare_digest(token.encode(), self._token.encode()):
+                            reply = self._reply(False, "unauthorized")
+                        else:
+                            try:
+                                reply, serving = self.handle(command)
+                            except Exception as e:
+                                # e.g. PortAudioError for a missing mic — report it, keep serving
+                                log(f"[command error] {command}: {e}")
+                                reply = self._reply(False, str(e))
+                        conn.sendall((json.dumps(reply) + "\n").encode())
+                    except OSError as e:
+                        log(f"[client error] {e}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop_session()
+            server.close()
+            if isinstance(target, str) and os.path.exists(target):
+                os.unlink(target)
+            if os.path.exists(token_file):
+                os.unlink(token_file)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket file left by a crashed daemon; refuse if one is still live."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        log(f"ERROR: A daemon is already running on {path}")
+        sys.exit(1)
+    finally:
+        probe.close()
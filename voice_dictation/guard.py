@@ -0,0 +1,144 @@
+"""Hallucination guard — filters decoded segments using Whisper's decoder statistics."""
+
+import re
+import threading
+import zlib
+from dataclasses import replace
+
+from .transcriber import Segment
+
+# Stock phrases Whisper emits on noise and near-silent tails
+HALLUCINATION_PHRASES = {
+    "thank you",
+    "thank you very much",
+    "thanks for watching",
+    "thank you for watching",
+    "please subscribe",
+    "subtitles by the amara org community",
+    "you",
+    "bye",
+}
+
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+# A run of 1-12 words repeated back to back at least three times ("the the the")
+_WORD_LOOP = re.compile(r"(\b(?:\w+\W+){1,12}?)\1{2,}")
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[^\w\s]", "", text).strip().lower()
+
+
+def _compression_ratio(text: str) -> float:
+    """Same measure faster-whisper reports: raw bytes over zlib-compressed bytes."""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
+
+
+def _collapse_sentence_runs(text: str, min_copies: int) -> str:
+    """Keep one copy of any sentence repeated back to back `min_copies`+ times."""
+    sentences = _SENTENCE_SPLIT.split(text.strip())
+    out: list[str] = []
+    run: list[str] = []
+    for sentence in sentences + [None]:
+        if run and sentence is not None and _normalize(sentence) and _normalize(sentence) == _normalize(run[0]):
+            run.append(sentence)
+            continue
+        out.extend(run[:1] if len(run) >= min_copies else run)
+        run = [sentence] if sentence is not None else []
+    return " ".join(out)
+
+
+class HallucinationGuard:
+    """Filters decoded segments before they reach local agreement.
+
+    Live passes decode without timestamps, so a segment is usually the whole
+    buffer. Rules therefore repair text where they can and only drop a segment
+    when nothing trustworthy is left:
+
+    no_speech:  the decode was empty — faster-whisper skipped the window
+                (no_speech_prob > 0.6 with low logprob) or produced no text.
+    repeat:     repeated sentences or word loops were collapsed to one copy.
+                Sentences repeated twice are only collapsed when the decoder
+                was unsure (high compression ratio or low avg_logprob); three or
+                more copies are collapsed regardless. Word loops are only
+                collapsed when the compression ratio flags degeneration.
+    repetition: still degenerate after collapsing — the segment is dropped.
+    phrase:     a stock phrase that is both likely silence and decoded poorly.
+    """
+
+    def __init__(
+        self,
+        logprob_threshold: float = -1.0,
+        compression_ratio_threshold: float = 2.4,
+        phrase_no_speech_threshold: float = 0.4,
+        phrase_logprob_threshold: float = -0.7,
+        long_run_copies: int = 3,
+    ):
+        self.logprob_threshold = logprob_threshold
+        self.compression_ratio_threshold = compression_ratio_threshold
+        self.phrase_no_speech_threshold = phrase_no_speech_threshold
+        self.phrase_logprob_threshold = phrase_logprob_threshold
+        self.long_run_copies = long_run_copies
+
+        # Shared across batch workers, so counters are updated under a lock
+        self._lock = threading.Lock()
+        self.counters = {"no_speech": 0, "repeat": 0, "repetition": 0, "phrase": 0}
+
+    def filter(self, segments: list[Segment]) -> list[Segment]:
+        """Return the segments that should be emitted. Call only for non-empty audio."""
+        if not segments:
+            self._count("no_speech")
+            return []
+        kept: list[Segment] = []
+        for seg in segments:
+            seg = self._collapse_repeats(seg)
+            reason = self._drop_reason(seg, kept[-1] if kept else None)
+            if reason is None:
+                kept.append(seg)
+            else:
+                self._count(reason)
+        return kept
+
+    def _count(self, reason: str) -> None:
+        with self._lock:
+            self.counters[reason] += 1
+
+    def _collapse_repeats(self, seg: Segment) -> Segment:
+        unsure = (
+            seg.compression_ratio > self.compression_ratio_threshold
+            or seg.avg_logprob < self.logprob_threshold
+        )
+        text = _collapse_sentence_runs(seg.text, 2 if unsure else self.long_run_copies)
+        if seg.compression_ratio > self.compression_ratio_threshold:
+            text = _WORD_LOOP.sub(r"\1", text + " ").strip()
+        if _normalize(text) == _normalize(seg.text):
+            return seg
+        self._count("repeat")
+        # Keep Whisper's leading space so joined segments stay separated
+        return replace(seg, text=" " + text, compression_ratio=_compression_ratio(text))
+
+    def _drop_reason(self, seg: Segment, prev: Segment | None) -> str | None:
+        normalized = _normalize(seg.text)
+        if not normalized:
+            return None
+        if seg.compression_ratio > self.compression_ratio_threshold:
+            return "repetition"
+        if prev is not None and normalized == _normalize(prev.text):
+            return "repeat"
+        # Short real dictation ("Thank you.", "Bye.") often has a moderate
+        # no_speech_prob, so a stock phrase must also be decoded poorly
+        if (
+            normalized in HALLUCINATION_PHRASES
+            and seg.no_speech_prob > self.phrase_no_speech_threshold
+            and seg.avg_logprob < self.phrase_logprob_threshold
+        ):
+            return "phrase"
+        return None
+
+    def stats_lines(self) -> list[str]:
+        """Human-readable suppression counters, for end-of-session logs."""
+        with self._lock:
+            if not any(self.counters.values()):
+                return []
+            return ["  suppressed: " + ", ".join(f"{k}={v}" for k, v in self.counters.items() if v)]
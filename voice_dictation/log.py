@@ -0,0 +1,8 @@
+"""Status logging shared by the CLI, subcommands and daemon."""
+
+import sys
+
+
+def log(msg: str):
+    """Always print status to stderr so it shows even in --keyboard mode."""
+    print(msg, file=sys.stderr, flush=True)
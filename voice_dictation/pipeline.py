@@ -0,0 +1,162 @@
+"""Embeddable dictation pipeline — VAD gating, utterance endpointing, typed events."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from .guard import HallucinationGuard
+from .processor import StreamingProcessor
+from .spool import SessionRecorder
+from .transcriber import TranscriptionEngine
+from .vad import VADFilter
+
+
+@dataclass(frozen=True)
+class PartialEvent:
+    """Unstable tail of the current utterance; may change on the next pass."""
+    text: str
+
+
+@dataclass(frozen=True)
+class ConfirmedEvent:
+    """Newly committed text (stable across two consecutive passes)."""
+    text: str
+
+
+@dataclass(frozen=True)
+class EndpointEvent:
+    """End of an utterance. `text` is whatever the final flush added ("" if nothing)."""
+    text: str
+
+
+PipelineEvent = PartialEvent | ConfirmedEvent | EndpointEvent
+
+
+class Pipeline:
+    """Turns a stream of 16 kHz float32 audio blocks into dictation events.
+
+    This is the same orchestration the CLI runs: VAD opens an utterance, audio
+    keeps flowing to the processor through short pauses, and sustained silence
+    finalizes it. Use `feed()`/`flush()` from synchronous code, or `stream()`
+    to consume any (async) iterator of blocks as an async generator.
+
+    With a `recorder`, every block and event is spooled to disk for replay.
+    With `max_utterance_s`, an utterance is force-flushed once it reaches that length.
+    """
+
+    def __init__(
+        self,
+        engine: TranscriptionEngine,
+        vad: VADFilter,
+        chunk_size: float = 0.5,
+        min_silence_ms: int = 400,
+        sample_rate: int = 16000,
+        recorder: SessionRecorder | None = None,
+        guard: HallucinationGuard | None = None,
+        max_utterance_s: float | None = None,
+    ):
+        self._vad = vad
+        self._recorder = recorder
+        self._processor = StreamingProcessor(
+            engine, chunk_size=chunk_size, sample_rate=sample_rate, guard=guard,
+        )
+        # Short silence: keep accumulating audio (natural pauses between words)
+        # Long silence: finalize the utterance. Counted in samples so any
+        # block size endpoints after the same duration (never under 300 ms).
+        self._silence_limit = max(300, min_silence_ms) * sample_rate // 1000
+        self._speaking = False
+        self._silence_samples = 0
+        # Optional cap so speech with no pause cannot buffer without bound
+        self._max_utterance_samples = None if max_utterance_s is None else int(max_utterance_s * sample_rate)
+        self._utterance_samples = 0
+
+    @property
+    def speaking(self) -> bool:
+        """True while an utterance is open."""
+        return self._speaking
+
+    def feed(self, chunk: np.ndarray) -> list[PipelineEvent]:
+        """Process one audio block and return the events it produced."""
+        has_speech = self._vad.is_speech(chunk)
+        if self._recorder is not None:
+            if has_speech and not self._speaking:
+                self._recorder.mark("speech_start")
+            self._recorder.write(chunk)
+        if not has_speech and not self._speaking:
+            return []
+
+        self._speaking = True
+        self._utterance_samples += len(chunk)
+        if has_speech:
+            self._silence_samples = 0
+        else:
+            self._silence_samples += len(chunk)
+
+        # Brief silence inside an utterance is still fed — Whisper needs the
+        # full context, and natural speech has pauses between words/phrases.
+        # No new speech is arriving during a pause, so spend the pass on
+        # settling text (confirm profile) rather than on a fast partial.
+        events: list[PipelineEvent] = []
+        profile = "partial" if has_speech else "confirm"
+        confirmed, partial = self._processor.feed_audio(chunk, profile=profile)
+        if confirmed:
+            events.append(ConfirmedEvent(confirmed))
+            if self._recorder is not None:
+                self._recorder.mark("confirmed", confirmed)
+        if partial:
+            events.append(PartialEvent(partial))
+
+        if self._silence_samples >= self._silence_limit or (
+            self._max_utterance_samples is not None
+            and self._utterance_samples >= self._max_utterance_samples
+        ):
+            events.extend(self.flush())
+        return events
+
+    def flush(self) -> list[PipelineEvent]:
+        """Finalize the open utterance, if any. Safe to call at any time."""
+        if not self._speaking:
+            return []
+        remaining = self._processor.finish()
+        self._speaking = False
+        self._silence_samples = 0
+        self._utterance_samples = 0
+        self._vad.reset()
+        if self._recorder is not None:
+            self._recorder.mark("endpoint", remaining)
+        return [EndpointEvent(remaining)]
+
+    async def stream(
+        self, source: Iterable[np.ndarray] | AsyncIterable[np.ndarray]
+    ) -> AsyncIterator[PipelineEvent]:
+        """Consume audio blocks from `source` and yield events as they occur.
+
+        VAD and transcription are blocking, so they run in a worker thread to
+        keep the event loop responsive. Plain iterators are also pulled from a
+        worker thread, since audio sources typically block until data arrives.
+        The open utterance is flushed when the source is exhausted.
+        """
+        async for chunk in _aiter_blocks(source):
+            for event in await asyncio.to_thread(self.feed, chunk):
+                yield event
+        for event in await asyncio.to_thread(self.flush):
+            yield event
+
+
+async def _aiter_blocks(
+    source: Iterable[np.ndarray] | AsyncIterable[np.ndarray],
+) -> AsyncIterator[np.ndarray]:
+    if isinstance(source, AsyncIterable):
+        async for chunk in source:
+            yield chunk
+        return
+
+    it = iter(source)
+    done = object()
+    while True:
+        chunk = await asyncio.to_thread(next, it, done)
+        if chunk is done:
+            return
+        yield chunk
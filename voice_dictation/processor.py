@@ -2,12 +2,20 @@
 
 import time
 import numpy as np
+from .guard import HallucinationGuard
 from .transcriber import TranscriptionEngine
 
 
 class StreamingProcessor:
-    def __init__(self, engine: TranscriptionEngine, chunk_size: float = 1.0, sample_rate: int = 16000):
+    def __init__(
+        self,
+        engine: TranscriptionEngine,
+        chunk_size: float = 1.0,
+        sample_rate: int = 16000,
+        guard: HallucinationGuard | None = None,
+    ):
         self._engine = engine
+        self._guard = guard or HallucinationGuard()
         self._chunk_interval = chunk_size
         self._sample_rate = sample_rate
 
@@ -17,10 +25,11 @@ class StreamingProcessor:
         self._prev_text = ""
         self._committed_text = ""
 
-    def feed_audio(self, audio: np.ndarray) -> tuple[str | None, str]:
+    def feed_audio(self, audio: np.ndarray, profile: str = "partial") -> tuple[str | None, str]:
         """Feed an audio chunk. Returns (new_confirmed_text or None, partial_text).
 
-        Transcription runs only when enough time has passed since the last run.
+        Transcription runs only when enough time has passed since the last run,
+        using the engine decode profile named by `profile`.
         """
         self._audio_chunks.append(audio)
         self._total_samples += len(audio)
@@ -35,11 +44,11 @@ class StreamingProcessor:
             return None, ""
 
         self._last_transcribe_time = now
-        return self._do_transcribe()
+        return self._do_transcribe(profile)
 
-    def _do_transcribe(self) -> tuple[str | None, str]:
+    def _do_transcribe(self, profile: str) -> tuple[str | None, str]:
         full_audio = np.concatenate(self._audio_chunks)
-        current_text = self._engine.transcribe(full_audio)
+        current_text = self._transcribe(full_audio, profile)
 
         if not current_text:
             self._prev_text = ""
@@ -64,15 +73,20 @@ class StreamingProcessor:
         return confirmed_new, partial
 
     def finish(self) -> str:
-        """Flush remaining buffer, return any uncommitted text."""
+        """Flush remaining buffer with the final decode profile, return any uncommitted text."""
         if not self._audio_chunks:
             return ""
         full_audio = np.concatenate(self._audio_chunks)
-        text = self._engine.transcribe(full_audio)
+        text = self._transcribe(full_audio, "final")
         remaining = text[len(self._committed_text):] if text else ""
         self.reset()
         return remaining.strip()
 
+    def _transcribe(self, audio: np.ndarray, profile: str) -> str:
+        # Filter before local agreement so suppressed text is never confirmed
+        segments = self._guard.filter(self._engine.transcribe_segments(audio, profile=profile))
+        return "".join(s.text for s in segments).strip()
+
     def reset(self):
         """Reset state for a new utterance."""
         self._audio_chunks.clear()
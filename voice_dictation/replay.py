@@ -0,0 +1,115 @@
+"""Replay a recorded session (see spool.py) through the dictation pipeline."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .log import log
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="voice-dictation replay",
+        description="Replay a recorded session, or part of it, through the pipeline.",
+    )
+    p.add_argument("session", type=Path,
+                   help="Session directory written by --record")
+    p.add_argument("--list", action="store_true",
+                   help="List recorded utterances and exit")
+    p.add_argument("--utterance", type=int, default=None,
+                   help="Replay only utterance N (see --list)")
+    p.add_argument("--start", type=float, default=0.0,
+                   help="Start of the range to replay in seconds (default: 0)")
+    p.add_argument("--end", type=float, default=None,
+                   help="End of the range to replay in seconds (default: end of session)")
+    p.add_argument("--speed", type=float, default=1.0,
+                   help="Playback speed; partial passes are paced by wall-clock time, "
+                        "so 1.0 reproduces live behavior. 0 = as fast as possible (default: 1.0)")
+    p.add_argument("--model", default="distil-large-v3",
+                   choices=["tiny", "base", "small", "medium", "large-v2", "large-v3", "large-v3-turbo", "distil-large-v3"],
+                   help="Whisper model (default: distil-large-v3)")
+    p.add_argument("--language", default="en",
+                   help="Language code, e.g. en, es, de (default: en)")
+    p.add_argument("--chunk-size", type=float, default=0.5,
+                   help="Min audio chunk in seconds (default: 0.5)")
+    p.add_argument("--beam-size", type=int, default=5,
+                   help="Beam size for the final pass of each utterance; partial passes are greedy (default: 5)")
+    p.add_argument("--compute-type", default="float16",
+                   choices=["float16", "int8_float16", "int8"],
+                   help="Compute type (default: float16)")
+    p.add_argument("--vad-threshold", type=float, default=0.4,
+                   help="VAD speech probability threshold (default: 0.4)")
+    p.add_argument("--min-silence-ms", type=int, default=400,
+                   help="Min silence duration to end speech segment in ms (default: 400)")
+    return p.parse_args(argv)
+
+
+def list_utterances(reader) -> None:
+    print(f"{reader.directory}: {reader.duration:.1f}s recorded")
+    for i, (start, end) in enumerate(reader.utterances()):
+        print(f"  [{i}] {start:8.2f}s - {end:8.2f}s")
+
+
+def run(args: argparse.Namespace) -> None:
+    from .spool import AUDIO_FILE, SessionReader
+
+    if not (args.session / AUDIO_FILE).is_file():
+        log(f"ERROR: Not a recorded session: {args.session}")
+        sys.exit(1)
+    reader = SessionReader(args.session)
+    if args.list:
+        list_utterances(reader)
+        return
+
+    start, end = args.start, args.end
+    if args.utterance is not None:
+        spans = reader.utterances()
+        if not 0 <= args.utterance < len(spans):
+            log(f"ERROR: Session has {len(spans)} utterances.")
+            sys.exit(1)
+        start, end = spans[args.utterance]
+
+    from .vad import VADFilter
+    from .transcriber import TranscriptionEngine
+    from .pipeline import ConfirmedEvent, EndpointEvent, Pipeline
+    from .guard import HallucinationGuard
+
+    engine = TranscriptionEngine(
+        model_name=args.model,
+        compute_type=args.compute_type,
+        language=args.language,
+        beam_size=args.beam_size,
+    )
+    engine.warmup()
+    vad = VADFilter(threshold=args.vad_threshold)
+    guard = HallucinationGuard()
+    pipeline = Pipeline(
+        engine,
+        vad,
+        chunk_size=args.chunk_size,
+        min_silence_ms=args.min_silence_ms,
+        guard=guard,
+    )
+
+    log(f"Replaying {start:.2f}s - {end if end is not None else reader.duration:.2f}s")
+    t0 = time.monotonic()
+    played = 0.0
+    for block in reader.iter_blocks(start, end):
+        events = pipeline.feed(block)
+        played += len(block) / reader.sample_rate
+        for event in events:
+            if isinstance(event, ConfirmedEvent):
+                print(f"{start + played:8.2f}s [confirmed] {event.text.strip()}", flush=True)
+            elif isinstance(event, EndpointEvent):
+                print(f"{start + played:8.2f}s [endpoint]  {event.text.strip()}", flush=True)
+        if args.speed > 0:
+            # Keep wall-clock pace so chunk_size-driven passes match the live session
+            delay = played / args.speed - (time.monotonic() - t0)
+            if delay > 0:
+                time.sleep(delay)
+    for event in pipeline.flush():
+        print(f"{start + played:8.2f}s [endpoint]  {event.text.strip()}", flush=True)
+
+    for line in engine.stats_lines() + guard.stats_lines():
+        log(line)
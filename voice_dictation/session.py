@@ -0,0 +1,52 @@
+"""Live dictation session loop — microphone through the pipeline to an output."""
+
+import sys
+import traceback
+
+from .log import log
+from .pipeline import ConfirmedEvent, EndpointEvent, PartialEvent
+
+
+def emit_events(events, output, console: bool):
+    """Render pipeline events to the output and status log."""
+    for event in events:
+        if isinstance(event, ConfirmedEvent):
+            output.print_confirmed(event.text)
+            log(f"[confirmed] {event.text.strip()}")
+        elif isinstance(event, PartialEvent):
+            if console:
+                output.print_partial(event.text)
+        elif isinstance(event, EndpointEvent):
+            if event.text:
+                output.print_confirmed(event.text)
+                log(f"[flushed] {event.text.strip()}")
+            output.print_confirmed(" ")
+            log("[end of utterance]")
+
+
+def run_session(audio, pipeline, output, console: bool, should_stop) -> None:
+    """Dictate from already-started `audio` until `should_stop()` returns True, then flush.
+
+    Callers start the stream themselves so a device error surfaces to them.
+    """
+    try:
+        while not should_stop():
+            chunk = audio.get_audio(timeout=0.1)
+            if chunk is None:
+                continue
+
+            was_speaking = pipeline.speaking
+            events = pipeline.feed(chunk)
+            if pipeline.speaking and not was_speaking:
+                log("[listening...]")
+            emit_events(events, output, console)
+
+    except Exception as e:
+        log(f"\nError: {e}")
+        traceback.print_exc(file=sys.stderr)
+    finally:
+        audio.stop()
+        for event in pipeline.flush():
+            if event.text:
+                output.print_confirmed(event.text)
+        output.commit_line()
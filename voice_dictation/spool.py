@@ -0,0 +1,146 @@
+"""Session spool — append captured audio and event markers to disk, replay via mmap.
+
+A session is a directory holding two append-only files:
+
+    audio.f32      raw little-endian float32 samples at 16 kHz
+    markers.jsonl  one {"sample": offset, "kind": ..., "text": ...} per line
+
+Sample offsets index straight into audio.f32, so any time range can be read
+from a memory map without loading the session into RAM.
+"""
+
+import json
+import queue
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from .log import log
+
+AUDIO_FILE = "audio.f32"
+MARKERS_FILE = "markers.jsonl"
+
+
+class SessionRecorder:
+    """Spools audio and markers from a background writer thread.
+
+    `write()` and `mark()` only enqueue, so they are safe to call from the
+    processing loop without adding disk I/O to it.
+    """
+
+    def __init__(self, directory: Path, sample_rate: int = 16000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.sample_rate = sample_rate
+
+        audio_path = self.directory / AUDIO_FILE
+        # Appending to an existing session continues its sample timeline
+        self._samples = audio_path.stat().st_size // 4 if audio_path.exists() else 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._failed = False
+        self._audio_file = open(audio_path, "ab")
+        self._markers_file = open(self.directory / MARKERS_FILE, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def samples(self) -> int:
+        """Samples recorded so far (including those still queued)."""
+        return self._samples
+
+    def write(self, audio: np.ndarray) -> None:
+        if self._failed:
+            return
+        self._queue.put(audio)
+        self._samples += len(audio)
+
+    def mark(self, kind: str, text: str = "") -> None:
+        """Record an event at the current end of the audio timeline."""
+        if self._failed:
+            return
+        self._queue.put({"sample": self._samples, "kind": kind, "text": text})
+
+    def close(self) -> None:
+        """Drain pending writes and close the files."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if isinstance(item, dict):
+                    self._markers_file.write(json.dumps(item, ensure_ascii=False) + "\n")
+                else:
+                    self._audio_file.write(np.asarray(item, dtype="<f4").tobytes())
+                if self._queue.empty():
+                    self._audio_file.flush()
+                    self._markers_file.flush()
+        except OSError as e:
+            # e.g. disk full — stop recording rather than queueing forever
+            self._failed = True
+            log(f"[recorder] Write failed, recording stopped: {e}")
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        finally:
+            self._audio_file.close()
+            self._markers_file.close()
+
+
+class SessionReader:
+    """Memory-mapped access to a recorded session."""
+
+    def __init__(self, directory: Path, sample_rate: int = 16000):
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+
+        audio_path = self.directory / AUDIO_FILE
+        # np.memmap rejects empty files
+        if audio_path.stat().st_size >= 4:
+            self.audio = np.memmap(audio_path, dtype="<f4", mode="r")
+        else:
+            self.audio = np.zeros(0, dtype=np.float32)
+
+        self.markers: list[dict] = []
+        markers_path = self.directory / MARKERS_FILE
+        if markers_path.exists():
+            with open(markers_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.markers.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # partial line from an interrupted session
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / self.sample_rate
+
+    def read(self, start: float = 0.0, end: float | None = None) -> np.ndarray:
+        """Samples between `start` and `end` seconds, as a view into the map."""
+        first = max(0, int(start * self.sample_rate))
+        last = len(self.audio) if end is None else min(len(self.audio), int(end * self.sample_rate))
+        return self.audio[first:last]
+
+    def utterances(self) -> list[tuple[float, float]]:
+        """(start, end) in seconds of each utterance, from speech_start/endpoint markers."""
+        spans = []
+        start = None
+        for m in self.markers:
+            if m["kind"] == "speech_start" and start is None:
+                start = m["sample"]
+            elif m["kind"] == "endpoint" and start is not None:
+                spans.append((start / self.sample_rate, m["sample"] / self.sample_rate))
+                start = None
+        if start is not None:
+            spans.append((start / self.sample_rate, self.duration))
+        return spans
+
+    def iter_blocks(self, start: float = 0.0, end: float | None = None, block_duration_ms: int = 100):
+        """Yield float32 blocks for a time range, shaped like live capture output."""
+        audio = self.read(start, end)
+        block_size = self.sample_rate * block_duration_ms // 1000
+        for i in range(0, len(audio), block_size):
+            yield np.array(audio[i:i + block_size], dtype=np.float32)
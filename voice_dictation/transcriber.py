@@ -1,9 +1,53 @@
 """Transcription engine wrapping faster-whisper."""
 
 import sys
+import threading
+import time
+from dataclasses import dataclass
+
 import numpy as np
 from faster_whisper import WhisperModel
 
+# faster-whisper's default temperature fallback schedule
+FALLBACK_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+@dataclass(frozen=True)
+class DecodeProfile:
+    beam_size: int = 1
+    temperature: float | tuple[float, ...] = 0.0
+    # Cap output at this many tokens per second of audio (plus a small floor).
+    # Fast speech runs ~4-5 tokens/s, so 6 only bites on runaway loops.
+    max_tokens_per_second: float | None = None
+
+    def max_new_tokens(self, audio_seconds: float) -> int | None:
+        if self.max_tokens_per_second is None:
+            return None
+        return 8 + int(self.max_tokens_per_second * audio_seconds)
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Decoded text with the decoder statistics used to judge it."""
+    text: str
+    no_speech_prob: float
+    avg_logprob: float
+    compression_ratio: float
+
+
+def default_profiles(final_beam_size: int = 5) -> dict[str, DecodeProfile]:
+    """Decode settings per pass kind.
+
+    partial — throwaway live passes: greedy, no fallback, capped output.
+    confirm — passes during pauses that settle text: greedy with fallback.
+    final   — the authoritative flush of an utterance: beam search with fallback.
+    """
+    return {
+        "partial": DecodeProfile(beam_size=1, temperature=0.0, max_tokens_per_second=6.0),
+        "confirm": DecodeProfile(beam_size=1, temperature=FALLBACK_TEMPERATURES),
+        "final": DecodeProfile(beam_size=final_beam_size, temperature=FALLBACK_TEMPERATURES),
+    }
+
 
 class TranscriptionEngine:
     def __init__(
@@ -11,32 +55,91 @@ class TranscriptionEngine:
         model_name: str = "large-v3-turbo",
         compute_type: str = "float16",
         language: str | None = None,
-        beam_size: int = 1,
+        beam_size: int = 5,
+        num_workers: int = 1,
+        profiles: dict[str, DecodeProfile] | None = None,
     ):
         self.language = language
-        self.beam_size = beam_size
+        self.profiles = profiles or default_profiles(final_beam_size=beam_size)
+
+        # Per-profile: passes, decode seconds, audio seconds, segments, summed avg_logprob
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, list[float]] = {}
 
         print(f"Loading model '{model_name}' ({compute_type}) on CUDA...", end=" ", file=sys.stderr, flush=True)
         self._model = WhisperModel(
             model_name,
             device="cuda",
             compute_type=compute_type,
+            num_workers=num_workers,  # >1 lets transcribe() run concurrently from several threads
         )
         print("done.", file=sys.stderr, flush=True)
 
-    def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe audio array, return concatenated text."""
+    def transcribe(self, audio: np.ndarray, profile: str = "final") -> str:
+        """Transcribe audio array with the named decode profile, return concatenated text."""
+        return "".join(s.text for s in self.transcribe_segments(audio, profile)).strip()
+
+    def transcribe_segments(self, audio: np.ndarray, profile: str = "final") -> list[Segment]:
+        """Transcribe audio array with the named decode profile, return segments with metadata."""
+        settings = self.profiles[profile]
+        audio_seconds = len(audio) / 16000
+        start = time.perf_counter()
         segments, _ = self._model.transcribe(
             audio,
-            beam_size=self.beam_size,
+            beam_size=settings.beam_size,
+            temperature=settings.temperature,
+            max_new_tokens=settings.max_new_tokens(audio_seconds),
             language=self.language,
             vad_filter=False,  # we handle VAD externally
             without_timestamps=True,
             condition_on_previous_text=False,
         )
-        return "".join(s.text for s in segments).strip()
+        # segments is a lazy generator — decoding happens while collecting
+        result = [
+            Segment(s.text, s.no_speech_prob, s.avg_logprob, s.compression_ratio)
+            for s in segments
+        ]
+        self._record(profile, time.perf_counter() - start, audio_seconds, result)
+        return result
+
+    def _record(self, profile: str, elapsed: float, audio_seconds: float, segments: list[Segment]) -> None:
+        with self._stats_lock:
+            entry = self._stats.setdefault(profile, [0, 0.0, 0.0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] += audio_seconds
+            entry[3] += len(segments)
+            entry[4] += sum(s.avg_logprob for s in segments)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-profile pass count, mean latency (ms), real-time factor and mean avg_logprob.
+
+        Mean avg_logprob is the decoder's confidence (closer to 0 is better),
+        the accuracy side of each profile's latency trade-off.
+        """
+        with self._stats_lock:
+            return {
+                name: {
+                    "passes": count,
+                    "mean_ms": 1000 * elapsed / count,
+                    "rtf": elapsed / audio if audio else 0.0,
+                    "mean_logprob": logprob / num_segments if num_segments else 0.0,
+                }
+                for name, (count, elapsed, audio, num_segments, logprob) in self._stats.items()
+            }
+
+    def stats_lines(self) -> list[str]:
+        """Human-readable per-profile timing and confidence, for end-of-session logs."""
+        return [
+            f"  {name:<8} {s['passes']:>5} passes, {s['mean_ms']:7.1f} ms avg, RTF {s['rtf']:.3f}, "
+            f"logprob {s['mean_logprob']:.3f}"
+            for name, s in self.stats().items()
+        ]
 
     def warmup(self) -> None:
-        """Run a short transcription to warm up the model."""
+        """Run a short transcription per profile to warm up the model."""
         silence = np.zeros(16000, dtype=np.float32)  # 1 second of silence
-        self.transcribe(silence)
+        for profile in self.profiles:
+            self.transcribe(silence, profile=profile)
+        with self._stats_lock:
+            self._stats.clear()